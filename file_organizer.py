@@ -1,18 +1,18 @@
 import os
 import shutil
 import argparse
-import tkinter as tk
-from tkinter import filedialog, ttk, messagebox, scrolledtext
 from datetime import datetime
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import threading
 import time
-import calendar
+import queue
+import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from collections import defaultdict
-import tkinterdnd2 as tkdnd
-import humanize
+
+logger = logging.getLogger(__name__)
 
 # Try to import magic, if it fails, we'll use extension-based detection only
 try:
@@ -20,185 +20,429 @@ try:
     MAGIC_AVAILABLE = True
 except ImportError:
     MAGIC_AVAILABLE = False
-    print("Warning: python-magic-bin not available. Using extension-based detection only.")
+    logger.warning("Warning: python-magic-bin not available. Using extension-based detection only.")
+
+# Moves are I/O bound, so use more worker threads than CPUs
+DEFAULT_MAX_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+
+# Bytes read from the start of a file for magic number detection. Only the
+# header is needed, whatever the file size; 2 KiB covers signatures that
+# sit past the first few hundred bytes, such as tar's at offset 257.
+MAGIC_HEADER_SIZE = 2048
+
+# Month folder names, indexed by month number
+_MONTHS = ('', 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+# Minimum seconds between publishing running statistics during a run
+STATS_PUBLISH_INTERVAL = 0.1
+
+# Seconds without new file events before a monitored folder is organized;
+# also gives files time to be completely written
+MONITOR_SETTLE_TIME = 1.0
+
+# File extension mappings
+FILE_TYPES = {
+    'Images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg'],
+    'Documents': ['.pdf', '.doc', '.docx', '.txt', '.xlsx', '.xls', '.ppt', '.pptx'],
+    'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv'],
+    'Audio': ['.mp3', '.wav', '.flac', '.m4a'],
+    'Archives': ['.zip', '.rar', '.7z', '.tar', '.gz'],
+    'Code': ['.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.h']
+}
+
+# Magic number MIME type mappings
+MIME_TYPES = {
+    'image/': 'Images',
+    'application/pdf': 'Documents',
+    'application/msword': 'Documents',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'Documents',
+    'application/vnd.ms-excel': 'Documents',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'Documents',
+    'application/vnd.ms-powerpoint': 'Documents',
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': 'Documents',
+    'text/': 'Documents',
+    'video/': 'Videos',
+    'audio/': 'Audio',
+    'application/zip': 'Archives',
+    'application/x-rar-compressed': 'Archives',
+    'application/x-7z-compressed': 'Archives',
+    'application/x-tar': 'Archives',
+    'application/gzip': 'Archives',
+    'text/x-python': 'Code',
+    'text/javascript': 'Code',
+    'text/html': 'Code',
+    'text/css': 'Code',
+    'text/x-java': 'Code',
+    'text/x-c++': 'Code',
+    'text/x-c': 'Code'
+}
+
+# Lookup tables derived from the fixed tables above, built once per process
+_EXT_TO_CATEGORY = {
+    ext: category
+    for category, extensions in FILE_TYPES.items()
+    for ext in extensions
+}
+_MIME_EXACT = {
+    mime: category for mime, category in MIME_TYPES.items()
+    if not mime.endswith('/')
+}
+_MIME_PREFIX = {
+    mime: category for mime, category in MIME_TYPES.items()
+    if mime.endswith('/')
+}
+
+def get_file_extension(filename):
+    """Return the lowercased extension of a file name, like os.path.splitext.
+
+    Args:
+        filename (str): Bare file name without directories; leading dots do
+            not start an extension ('.bashrc' has none)
+
+    Returns:
+        str: The extension including its dot, or '' if there is none
+    """
+    head, dot, ext = filename.rpartition('.')
+    if not dot or not head.strip('.'):
+        return ''
+    return '.' + ext.lower()
 
 class FileOrganizer:
     def __init__(self):
-        self.file_types = {
-            'Images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg'],
-            'Documents': ['.pdf', '.doc', '.docx', '.txt', '.xlsx', '.xls', '.ppt', '.pptx'],
-            'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv'],
-            'Audio': ['.mp3', '.wav', '.flac', '.m4a'],
-            'Archives': ['.zip', '.rar', '.7z', '.tar', '.gz'],
-            'Code': ['.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.h']
-        }
+        self.file_types = FILE_TYPES
         
         # Statistics tracking
         self.stats = {
             'total_files': 0,
             'total_size': 0,
             'space_freed': 0,
-            'files_by_category': defaultdict(int),
-            'size_by_category': defaultdict(int)
+            'files_by_category': {},
+            'size_by_category': {}
         }
+        # Guards swapping in a new stats snapshot while others read it
+        self._stats_lock = threading.Lock()
         
         # Magic number MIME type mappings
-        self.mime_types = {
-            'image/': 'Images',
-            'application/pdf': 'Documents',
-            'application/msword': 'Documents',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'Documents',
-            'application/vnd.ms-excel': 'Documents',
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'Documents',
-            'application/vnd.ms-powerpoint': 'Documents',
-            'application/vnd.openxmlformats-officedocument.presentationml.presentation': 'Documents',
-            'text/': 'Documents',
-            'video/': 'Videos',
-            'audio/': 'Audio',
-            'application/zip': 'Archives',
-            'application/x-rar-compressed': 'Archives',
-            'application/x-7z-compressed': 'Archives',
-            'application/x-tar': 'Archives',
-            'application/gzip': 'Archives',
-            'text/x-python': 'Code',
-            'text/javascript': 'Code',
-            'text/html': 'Code',
-            'text/css': 'Code',
-            'text/x-java': 'Code',
-            'text/x-c++': 'Code',
-            'text/x-c': 'Code'
-        }
+        self.mime_types = MIME_TYPES
+        
+        # Precomputed lookup tables so classification is a dict hit, not a scan
+        self._ext_to_category = _EXT_TO_CATEGORY
+        self._mime_exact = _MIME_EXACT
+        self._mime_prefix = _MIME_PREFIX
+        
+        # Load the libmagic database once instead of on every lookup
+        self._magic = None
+        if MAGIC_AVAILABLE:
+            try:
+                self._magic = magic.Magic(mime=True)
+            except Exception as e:
+                logger.warning("Magic number detection unavailable, using extensions only: %s", e)
+        
+        # Categories of unknown-extension files the last run left in place
+        # (failed or cancelled moves), keyed by (path, size, mtime), so the
+        # next monitoring pass does not run magic detection on them again
+        self._cat_cache = {}
+        
+        # Date-based destination folders, cleared at the start of every run
+        self._date_path_cache = {}
 
     def reset_stats(self):
         """Reset all statistics to zero."""
-        self.stats = {
+        self.publish_stats({
             'total_files': 0,
             'total_size': 0,
             'space_freed': 0,
-            'files_by_category': defaultdict(int),
-            'size_by_category': defaultdict(int)
-        }
+            'files_by_category': {},
+            'size_by_category': {}
+        })
 
-    def get_file_size(self, file_path):
-        """Get the size of a file in bytes."""
-        try:
-            return os.path.getsize(file_path)
-        except Exception:
-            return 0
+    def publish_stats(self, stats):
+        """Replace the statistics with a copy of stats that is never modified afterwards."""
+        snapshot = dict(stats)
+        snapshot['files_by_category'] = dict(stats['files_by_category'])
+        snapshot['size_by_category'] = dict(stats['size_by_category'])
+        with self._stats_lock:
+            self.stats = snapshot
 
-    def get_file_category(self, file_path):
-        """Determine the category of a file using both extension and magic numbers."""
-        # First try magic number detection if available
-        if MAGIC_AVAILABLE:
+    def get_stats(self):
+        """Return the latest published statistics snapshot."""
+        with self._stats_lock:
+            return self.stats
+
+    def get_file_category(self, file_path, filename=None):
+        """Determine the category of a file from its extension, falling back to magic numbers."""
+        if filename is None:
+            filename = os.path.basename(file_path)
+        
+        # A known extension is enough; only unknown or missing ones need magic
+        file_extension = get_file_extension(filename)
+        category = self._ext_to_category.get(file_extension)
+        if category is not None:
+            return category
+        
+        # Fallback to magic number detection if available
+        if self._magic is not None:
             try:
-                mime_type = magic.from_file(file_path, mime=True)
-                for mime_prefix, category in self.mime_types.items():
-                    if mime_type.startswith(mime_prefix):
-                        return category
+                with open(file_path, 'rb') as f:
+                    header = f.read(MAGIC_HEADER_SIZE)
+                mime_type = self._magic.from_buffer(header)
+                category = self._mime_exact.get(mime_type)
+                if category is None:
+                    category = self._mime_prefix.get(mime_type.split('/', 1)[0] + '/')
+                if category is not None:
+                    return category
             except Exception as e:
-                print(f"Magic number detection failed: {str(e)}")
-        
-        # Fallback to extension-based detection
-        file_extension = os.path.splitext(file_path)[1].lower()
-        for category, extensions in self.file_types.items():
-            if file_extension in extensions:
-                return category
+                logger.debug("Magic number detection failed: %s", e)
         return 'Others'
 
-    def get_date_based_path(self, file_path, directory):
-        """Get the date-based path for a file."""
+    def get_date_based_path(self, file_path, directory, stat_result=None):
+        """Get the date-based path for a file.
+
+        Args:
+            file_path (str): Path of the file to place
+            directory (str): Folder the Year/Month folders are created in
+            stat_result (os.stat_result): Stat of the file, e.g. from
+                os.DirEntry.stat(); the file is stat-ed if omitted
+
+        Returns:
+            str: The Year/Month folder, or directory if the date is unavailable
+        """
         try:
+            if stat_result is None:
+                stat_result = os.stat(file_path)
             # Try to get creation time first, fall back to modification time
-            timestamp = os.path.getctime(file_path)
+            timestamp = stat_result.st_ctime
             if timestamp is None:
-                timestamp = os.path.getmtime(file_path)
+                timestamp = stat_result.st_mtime
             
             date = datetime.fromtimestamp(timestamp)
-            year = str(date.year)
-            month = calendar.month_name[date.month]
-            
-            return os.path.join(directory, year, month)
+            # Files from the same month share one joined path
+            key = (directory, date.year, date.month)
+            path = self._date_path_cache.get(key)
+            if path is None:
+                path = os.path.join(directory, str(date.year), _MONTHS[date.month])
+                self._date_path_cache[key] = path
+            return path
         except Exception as e:
-            print(f"Error getting date-based path: {str(e)}")
+            logger.warning("Error getting date-based path: %s", e)
             return directory
 
-    def organize_files(self, source_dir, date_based=False):
+    def move_file(self, file_path, filename, destination):
+        """Move a single file to its destination.
+
+        Args:
+            file_path (str): Current path of the file
+            filename (str): Name of the file, used in error messages
+            destination (str): Path to move the file to
+
+        Returns:
+            bool: True if the file was moved
+        """
+        try:
+            # Destinations live under the source folder, so a plain rename
+            # normally works; shutil.move handles anything it cannot. Both
+            # overwrite an existing destination file, as shutil.move always did.
+            try:
+                os.replace(file_path, destination)
+            except OSError:
+                shutil.move(file_path, destination)
+        except Exception as e:
+            logger.warning("Error moving %s: %s", filename, e)
+            return False
+        return True
+
+    @staticmethod
+    def count_move(stats, file_size, category, cross_drive):
+        """Add one moved file to a statistics dict.
+
+        Args:
+            stats (dict): Statistics dict shaped like FileOrganizer.stats
+            file_size (int): Size of the moved file in bytes
+            category (str): Category of the file, or None in date-based mode
+            cross_drive (bool): Whether the file moved to another drive
+        """
+        if category is not None:
+            stats['total_files'] += 1
+            stats['total_size'] += file_size
+            files_by_category = stats['files_by_category']
+            size_by_category = stats['size_by_category']
+            files_by_category[category] = files_by_category.get(category, 0) + 1
+            size_by_category[category] = size_by_category.get(category, 0) + file_size
+        if cross_drive:
+            stats['space_freed'] += file_size
+
+    def organize_files(self, source_dir, date_based=False, max_concurrency=DEFAULT_MAX_CONCURRENCY):
         """Organize files into appropriate folders based on their extensions or dates."""
+        for _ in self.iter_organize_files(source_dir, date_based, max_concurrency):
+            pass
+
+    def iter_organize_files(self, source_dir, date_based=False, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """Organize files like organize_files, yielding progress events as it goes.
+
+        Statistics only ever cover files actually moved. Closing the generator
+        cancels any moves that have not started yet.
+
+        Args:
+            source_dir (str): Directory containing the files to organize
+            date_based (bool): Whether to organize by date (Year/Month)
+            max_concurrency (int): Number of files to move in parallel
+
+        Yields:
+            tuple: ('scanned', count) for each file examined, then
+                ('moved', destination, folder) for each file moved, where
+                folder is the destination folder relative to source_dir
+        """
         # Reset statistics before starting
         self.reset_stats()
+        self._date_path_cache.clear()
         
         # First, collect all files and their categories
         files_by_category = defaultdict(list)
         
-        for filename in os.listdir(source_dir):
-            file_path = os.path.join(source_dir, filename)
-            
-            # Skip if it's a directory
-            if os.path.isdir(file_path):
-                continue
-            
-            try:
-                if date_based:
-                    destination_dir = self.get_date_based_path(file_path, source_dir)
-                    files_by_category[destination_dir].append((file_path, filename))
-                else:
-                    category = self.get_file_category(file_path)
-                    destination_dir = os.path.join(source_dir, category)
-                    files_by_category[destination_dir].append((file_path, filename))
-                    
-                    # Update statistics
-                    file_size = self.get_file_size(file_path)
-                    self.stats['total_files'] += 1
-                    self.stats['total_size'] += file_size
-                    self.stats['files_by_category'][category] += 1
-                    self.stats['size_by_category'][category] += file_size
-            except Exception as e:
-                print(f"Error processing {filename}: {str(e)}")
+        # Only entries for files that end up not being moved are kept
+        previous_cache = self._cat_cache
+        cat_cache = {}
         
-        # Only create folders and move files if there are files for that category
-        for destination_dir, files in files_by_category.items():
-            if files:  # Only create folder if there are files to move
-                if not os.path.exists(destination_dir):
-                    os.makedirs(destination_dir)
+        # A single scandir pass serves the type check and stat from each
+        # DirEntry instead of separate isdir/getsize/getctime calls per file
+        entries = []
+        with os.scandir(source_dir) as it:
+            for entry in it:
+                filename = entry.name
+                
+                try:
+                    # Skip if it's a directory, or a symlink to one
+                    if entry.is_dir():
+                        continue
+                    
+                    entries.append((filename, entry.path, entry.stat()))
+                except Exception as e:
+                    logger.warning("Error processing %s: %s", filename, e)
                 
-                for file_path, filename in files:
-                    try:
-                        destination = os.path.join(destination_dir, filename)
-                        # Calculate space that will be freed (if file is being moved to a different drive)
-                        source_drive = os.path.splitdrive(file_path)[0]
-                        dest_drive = os.path.splitdrive(destination)[0]
-                        if source_drive != dest_drive:
-                            self.stats['space_freed'] += self.get_file_size(file_path)
-                        
-                        shutil.move(file_path, destination)
-                    except Exception as e:
-                        print(f"Error moving {filename}: {str(e)}")
+                yield ('scanned', len(entries))
+        
+        if date_based:
+            for filename, file_path, stat_result in entries:
+                destination_dir = self.get_date_based_path(file_path, source_dir, stat_result)
+                files_by_category[destination_dir].append((file_path, filename, stat_result.st_size, None, None))
+        else:
+            # Classify the whole batch by extension in one pass; only files
+            # with an unknown extension go through the cache and magic
+            ext_to_category = self._ext_to_category
+            categories = [ext_to_category.get(get_file_extension(filename))
+                          for filename, _, _ in entries]
+            
+            category_dirs = {}
+            for (filename, file_path, stat_result), category in zip(entries, categories):
+                try:
+                    cache_key = None
+                    if category is None:
+                        cache_key = (file_path, stat_result.st_size, stat_result.st_mtime)
+                        category = previous_cache.get(cache_key)
+                        if category is None:
+                            category = self.get_file_category(file_path, filename)
+                        cat_cache[cache_key] = category
+                    destination_dir = category_dirs.get(category)
+                    if destination_dir is None:
+                        destination_dir = category_dirs[category] = os.path.join(source_dir, category)
+                    files_by_category[destination_dir].append(
+                        (file_path, filename, stat_result.st_size, category, cache_key))
+                except Exception as e:
+                    logger.warning("Error processing %s: %s", filename, e)
+        
+        source_drive = os.path.splitdrive(source_dir)[0]
+        
+        # Moves are counted here, in the generator's own thread, into a local
+        # dict that is published to self.stats in batches
+        stats = {
+            'total_files': 0,
+            'total_size': 0,
+            'space_freed': 0,
+            'files_by_category': {},
+            'size_by_category': {}
+        }
+        moves = {}
+        counted = set()
+        
+        # Created before any folder so a bad max_concurrency leaves none behind
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            # Only create folders if there are files for that category, each
+            # one once before any file is moved. A folder that cannot be
+            # created (e.g. a file already has its name) only skips its files.
+            for destination_dir, files in list(files_by_category.items()):
+                if not files:
+                    continue
+                try:
+                    os.makedirs(destination_dir, exist_ok=True)
+                except OSError as e:
+                    logger.warning("Error creating folder %s: %s", destination_dir, e)
+                    del files_by_category[destination_dir]
+            
+            for destination_dir, files in files_by_category.items():
+                folder = os.path.relpath(destination_dir, source_dir)
+                # Space is only freed if files move to a different drive
+                cross_drive = os.path.splitdrive(destination_dir)[0] != source_drive
+                for file_path, filename, file_size, category, cache_key in files:
+                    destination = os.path.join(destination_dir, filename)
+                    future = executor.submit(self.move_file, file_path, filename, destination)
+                    moves[future] = (destination, folder, file_size, category, cross_drive, cache_key)
+            
+            # Report moves as they finish rather than in submission order
+            last_publish = time.monotonic()
+            for future in as_completed(moves):
+                counted.add(future)
+                if future.result():
+                    destination, folder, file_size, category, cross_drive, cache_key = moves[future]
+                    self.count_move(stats, file_size, category, cross_drive)
+                    cat_cache.pop(cache_key, None)
+                    now = time.monotonic()
+                    if now - last_publish >= STATS_PUBLISH_INTERVAL:
+                        self.publish_stats(stats)
+                        last_publish = now
+                    yield ('moved', destination, folder)
+        finally:
+            executor.shutdown(cancel_futures=True)
+            # Moves still running when the generator was closed count too
+            for future, (_, _, file_size, category, cross_drive, cache_key) in moves.items():
+                if future not in counted and not future.cancelled() and future.result():
+                    self.count_move(stats, file_size, category, cross_drive)
+                    cat_cache.pop(cache_key, None)
+            self.publish_stats(stats)
+            self._cat_cache = cat_cache
 
 class FileHandler(FileSystemEventHandler):
-    def __init__(self, organizer, source_dir, date_based=False):
-        self.organizer = organizer
-        self.source_dir = source_dir
-        self.date_based = date_based
-        self.last_modified = {}  # Track last modified times to prevent duplicate processing
+    def __init__(self, rescan_queue):
+        # Holds at most one pending rescan request; a worker thread does the
+        # actual organizing so the observer thread never blocks on it
+        self.rescan_queue = rescan_queue
+
+    def request_rescan(self):
+        try:
+            self.rescan_queue.put_nowait(('rescan',))
+        except queue.Full:
+            pass  # A pending rescan already covers this event
 
     def on_created(self, event):
         if not event.is_directory:
-            # Add a small delay to ensure file is completely written
-            time.sleep(1)
-            self.organizer.organize_files(self.source_dir, self.date_based)
+            self.request_rescan()
 
     def on_modified(self, event):
         if not event.is_directory:
-            # Check if we've already processed this file recently
-            current_time = time.time()
-            if event.src_path in self.last_modified:
-                if current_time - self.last_modified[event.src_path] < 1:  # 1 second threshold
-                    return
-            self.last_modified[event.src_path] = current_time
-            self.organizer.organize_files(self.source_dir, self.date_based)
+            self.request_rescan()
+
+def load_gui_modules():
+    """Import the modules only the GUI needs, keeping them out of CLI startup."""
+    global tk, filedialog, ttk, messagebox, scrolledtext, tkdnd, humanize
+    import tkinter as tk
+    from tkinter import filedialog, ttk, messagebox, scrolledtext
+    import tkinterdnd2 as tkdnd
+    import humanize
 
 class FileOrganizerGUI:
     def __init__(self, root):
+        load_gui_modules()
         self.root = root
         self.root.title("File Organizer - Made by Aakash Sharma")
         self.root.geometry("800x700")
@@ -212,6 +456,19 @@ class FileOrganizerGUI:
         self.source_dir = None
         self.observer = None
         self.monitoring = False
+        self.monitor_queue = None
+        self.monitor_stop = None
+        # Finished monitoring passes, reported to the Tk thread
+        self.monitor_results = queue.Queue()
+        # Fixed display order of the category breakdown
+        self._category_order = list(self.organizer.file_types) + ['Others']
+        # Category breakdown rows by category, and the (count, size) they show
+        self._tree_row_ids = {}
+        self._last_tree = {}
+        self.organize_thread = None
+        self.cancel_requested = threading.Event()
+        self.progress_queue = queue.Queue()
+        self.scanned_count = None
         self.date_based = tk.BooleanVar(value=False)
         
         # Configure drag and drop
@@ -220,6 +477,14 @@ class FileOrganizerGUI:
         
         self.setup_gui()
         
+        # Route organizer log records to the log panel. Records can come from
+        # worker threads, so they are queued and drained on the Tk thread.
+        self.log_queue = queue.Queue()
+        self.log_handler = logging.handlers.QueueHandler(self.log_queue)
+        logger.addHandler(self.log_handler)
+        self.poll_log_queue()
+        self.poll_monitor_results()
+        
         # Show warning if magic is not available
         if not MAGIC_AVAILABLE:
             self.log_message("Warning: python-magic-bin not available. Using extension-based detection only.")
@@ -301,9 +566,20 @@ class FileOrganizerGUI:
         self.log_panel.see(tk.END)
         self.log_panel.configure(state='disabled')
 
+    def poll_log_queue(self):
+        """Show queued log records in the log panel."""
+        while True:
+            try:
+                record = self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.log_message(record.getMessage())
+        self.root.after(100, self.poll_log_queue)
+
     def update_dashboard(self):
         """Update the dashboard with current statistics."""
-        stats = self.organizer.stats
+        # A published snapshot is never modified, so reading it needs no lock
+        stats = self.organizer.get_stats()
         
         # Update total files
         self.total_files_var.set(f"{stats['total_files']:,}")
@@ -314,11 +590,29 @@ class FileOrganizerGUI:
         # Update space freed
         self.space_freed_var.set(humanize.naturalsize(stats['space_freed']))
         
-        # Update category breakdown
-        self.category_tree.delete(*self.category_tree.get_children())
-        for category, count in stats['files_by_category'].items():
-            size = humanize.naturalsize(stats['size_by_category'][category])
-            self.category_tree.insert('', 'end', values=(category, count, size))
+        # Update category breakdown in place, only touching changed rows and
+        # keeping them in the fixed category order
+        files_by_category = stats['files_by_category']
+        position = 0
+        for category in self._category_order:
+            count = files_by_category.get(category)
+            if not count:
+                row_id = self._tree_row_ids.pop(category, None)
+                if row_id is not None:
+                    self.category_tree.delete(row_id)
+                    del self._last_tree[category]
+                continue
+            
+            size = stats['size_by_category'].get(category, 0)
+            if self._last_tree.get(category) != (count, size):
+                self._last_tree[category] = (count, size)
+                values = (category, count, humanize.naturalsize(size))
+                row_id = self._tree_row_ids.get(category)
+                if row_id is None:
+                    self._tree_row_ids[category] = self.category_tree.insert('', position, values=values)
+                else:
+                    self.category_tree.item(row_id, values=values)
+            position += 1
 
     def handle_drop(self, event):
         """Handle files/folders dropped onto the window."""
@@ -382,6 +676,9 @@ class FileOrganizerGUI:
         organize_btn = ttk.Button(action_frame, text="Organize Files", command=self.organize_files)
         organize_btn.pack(side="left", padx=5)
         
+        self.cancel_btn = ttk.Button(action_frame, text="Cancel", command=self.cancel_organize, state="disabled")
+        self.cancel_btn.pack(side="left", padx=5)
+        
         self.monitor_btn = ttk.Button(action_frame, text="Start Monitoring", command=self.toggle_monitoring)
         self.monitor_btn.pack(side="left", padx=5)
         
@@ -451,14 +748,77 @@ class FileOrganizerGUI:
             self.log_message("Error: Please select a source directory")
             return
             
+        if self.organize_thread and self.organize_thread.is_alive():
+            self.log_message("Error: File organization is already running")
+            return
+        
+        # Organize in a background thread so the window stays responsive;
+        # progress events are handed back to the Tk thread through a queue
+        self.log_message("Starting file organization...")
+        self.cancel_requested.clear()
+        self.cancel_btn.config(state="normal")
+        self.organize_thread = threading.Thread(
+            target=self.run_organize,
+            args=(self.source_dir, self.date_based.get()),
+            daemon=True
+        )
+        self.organize_thread.start()
+        self.root.after(50, self.poll_progress)
+
+    def run_organize(self, source_dir, date_based):
+        """Run the organizer, queueing its progress events for the Tk thread."""
         try:
-            self.log_message("Starting file organization...")
-            self.organizer.organize_files(self.source_dir, self.date_based.get())
-            self.update_dashboard()
-            self.log_message("Files organized successfully!")
+            progress = self.organizer.iter_organize_files(source_dir, date_based)
+            try:
+                for event in progress:
+                    self.progress_queue.put(event)
+                    if self.cancel_requested.is_set():
+                        break
+            finally:
+                progress.close()
+            self.progress_queue.put(('cancelled',) if self.cancel_requested.is_set() else ('done',))
         except Exception as e:
-            error_msg = f"Error: {str(e)}"
-            self.log_message(error_msg)
+            self.progress_queue.put(('error', e))
+
+    def poll_progress(self):
+        """Apply queued progress events to the dashboard."""
+        finished = False
+        moved = False
+        while True:
+            try:
+                event = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == 'scanned':
+                self.scanned_count = event[1]
+                continue
+            if self.scanned_count is not None:
+                self.log_message(f"Scanned {self.scanned_count:,} files")
+                self.scanned_count = None
+            if kind == 'moved':
+                moved = True
+            else:
+                finished = True
+                if kind == 'done':
+                    self.log_message("Files organized successfully!")
+                elif kind == 'cancelled':
+                    self.log_message("File organization cancelled")
+                else:
+                    self.log_message(f"Error: {str(event[1])}")
+        
+        if moved or finished:
+            self.update_dashboard()
+        if finished:
+            self.cancel_btn.config(state="disabled")
+        else:
+            self.root.after(50, self.poll_progress)
+
+    def cancel_organize(self):
+        """Stop a running organization before its remaining files are moved."""
+        if self.organize_thread and self.organize_thread.is_alive():
+            self.cancel_requested.set()
+            self.log_message("Cancelling file organization...")
             
     def toggle_monitoring(self):
         if not self.source_dir:
@@ -471,38 +831,119 @@ class FileOrganizerGUI:
             self.stop_monitoring()
             
     def start_monitoring(self):
+        # Imported here as the observers pick a platform backend on import
+        from watchdog.observers import Observer
+        
+        # Each monitoring session gets its own queue and stop flag, so a
+        # worker still finishing an old pass never picks up a new session
+        self.monitor_queue = queue.Queue(maxsize=1)
+        self.monitor_stop = threading.Event()
+        monitor_thread = threading.Thread(
+            target=self.monitor_worker,
+            args=(self.source_dir, self.date_based.get(), self.monitor_queue, self.monitor_stop),
+            daemon=True
+        )
+        monitor_thread.start()
+        
         self.observer = Observer()
-        event_handler = FileHandler(self.organizer, self.source_dir, self.date_based.get())
+        event_handler = FileHandler(self.monitor_queue)
         self.observer.schedule(event_handler, self.source_dir, recursive=False)
         self.observer.start()
         self.monitoring = True
         self.monitor_btn.config(text="Stop Monitoring")
         self.log_message("Folder monitoring started")
         
+    def monitor_worker(self, source_dir, date_based, rescan_queue, stop):
+        """Organize the monitored folder once per burst of file events.
+
+        Runs off the Tk thread and never touches Tk; finished passes are
+        posted to monitor_results instead.
+
+        Args:
+            source_dir (str): Monitored directory
+            date_based (bool): Whether to organize by date (Year/Month)
+            rescan_queue (queue.Queue): Rescan requests from FileHandler
+            stop (threading.Event): Set when this monitoring session ends
+        """
+        while True:
+            rescan_queue.get()
+            if stop.is_set():
+                return
+            # Wait until the folder has been quiet for a while
+            try:
+                while True:
+                    rescan_queue.get(timeout=MONITOR_SETTLE_TIME)
+                    if stop.is_set():
+                        return
+            except queue.Empty:
+                pass
+            
+            try:
+                self.organizer.organize_files(source_dir, date_based)
+            except Exception as e:
+                logger.error("Error organizing %s: %s", source_dir, e)
+            else:
+                self.monitor_results.put(('monitored',))
+
+    def poll_monitor_results(self):
+        """Refresh the dashboard after monitoring passes finish."""
+        refreshed = False
+        while True:
+            try:
+                self.monitor_results.get_nowait()
+            except queue.Empty:
+                break
+            refreshed = True
+        if refreshed:
+            self.update_dashboard()
+        self.root.after(100, self.poll_monitor_results)
+        
     def stop_monitoring(self):
         if self.observer:
             self.observer.stop()
             self.observer.join()
+            # Signal the worker without waiting for it; a pass in progress
+            # finishes in the background instead of freezing the window
+            self.monitor_stop.set()
+            try:
+                self.monitor_queue.put_nowait(('stop',))
+            except queue.Full:
+                pass  # The worker wakes on the pending request and sees the stop flag
             self.monitoring = False
             self.monitor_btn.config(text="Start Monitoring")
             self.log_message("Folder monitoring stopped")
 
+def positive_int(value):
+    """argparse type for options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="File Organizer")
     parser.add_argument("--source", help="Source directory to organize")
     parser.add_argument("--mode", choices=["cli", "gui"], default="gui", help="Operation mode")
     parser.add_argument("--date-based", action="store_true", help="Organize files by date (Year/Month)")
+    parser.add_argument("--max-concurrency", type=positive_int, default=DEFAULT_MAX_CONCURRENCY,
+                        help="Number of files to move in parallel")
     args = parser.parse_args()
     
+    logging.basicConfig(format="%(message)s")
+    
     if args.mode == "cli":
         if not args.source:
             print("Please provide a source directory using --source")
             return
             
         organizer = FileOrganizer()
-        organizer.organize_files(args.source, args.date_based)
+        organizer.organize_files(args.source, args.date_based, args.max_concurrency)
         print("Files organized successfully!")
     else:
+        load_gui_modules()
         root = tkdnd.Tk()
         app = FileOrganizerGUI(root)
         root.mainloop()
@@ -0,0 +1,69 @@
+import argparse
+import os
+
+import pytest
+
+from file_organizer import FileOrganizer, get_file_extension, positive_int
+
+
+def make_files(directory, names):
+    for name in names:
+        (directory / name).write_text("x")
+
+
+def test_iter_organize_files_event_sequence(tmp_path):
+    make_files(tmp_path, ["a.jpg", "b.txt"])
+
+    events = list(FileOrganizer().iter_organize_files(str(tmp_path)))
+
+    assert events[:2] == [('scanned', 1), ('scanned', 2)]
+    assert set(events[2:]) == {
+        ('moved', os.path.join(str(tmp_path), 'Images', 'a.jpg'), 'Images'),
+        ('moved', os.path.join(str(tmp_path), 'Documents', 'b.txt'), 'Documents'),
+    }
+
+
+def test_iter_organize_files_close_counts_only_moved_files(tmp_path):
+    make_files(tmp_path, [f"file{i}.txt" for i in range(50)])
+    organizer = FileOrganizer()
+
+    progress = organizer.iter_organize_files(str(tmp_path), max_concurrency=1)
+    for event in progress:
+        if event[0] == 'moved':
+            break
+    progress.close()
+
+    moved = len(os.listdir(tmp_path / 'Documents'))
+    left = len([name for name in os.listdir(tmp_path) if name != 'Documents'])
+    stats = organizer.get_stats()
+    assert moved + left == 50
+    assert stats['total_files'] == moved
+    assert stats['total_size'] == moved
+    assert stats['files_by_category'] == {'Documents': moved}
+
+
+def test_organize_files_skips_destination_blocked_by_file(tmp_path):
+    # A file named like a category folder keeps that folder from being created
+    make_files(tmp_path, ["Others", "a.jpg"])
+    organizer = FileOrganizer()
+
+    organizer.organize_files(str(tmp_path))
+
+    assert (tmp_path / 'Others').is_file()
+    assert (tmp_path / 'Images' / 'a.jpg').is_file()
+    assert organizer.stats['files_by_category'] == {'Images': 1}
+
+
+@pytest.mark.parametrize("name", ['.bashrc', 'a.', '...', '.a.b', 'noext', 'A.PY'])
+def test_get_file_extension_matches_splitext(name):
+    assert get_file_extension(name) == os.path.splitext(name)[1].lower()
+
+
+def test_positive_int_accepts_whole_numbers():
+    assert positive_int('8') == 8
+
+
+@pytest.mark.parametrize("value", ['0', '-1'])
+def test_positive_int_rejects_values_below_one(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)